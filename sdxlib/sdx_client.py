@@ -1,14 +1,20 @@
 from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
 import logging
-import pandas as pd
 import re
 import requests
-from typing import Optional, List, Dict, Union
+from typing import TYPE_CHECKING, Optional, List, Dict, Union
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, HTTPError, Timeout
 
 from sdxlib.sdx_exception import SDXException
 from sdxlib.sdx_response import SDXResponse
 
+if TYPE_CHECKING:
+    # pandas is imported lazily by the methods that build DataFrames.
+    import pandas as pd
+
 # Basic configuration for logging to stdout
 # logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -33,8 +39,65 @@ class SDXClient:
     """
 
     PORT_ID_PATTERN = (
-        r"^urn:sdx:port:[a-zA-Z0-9.,-_\/]+:[a-zA-Z0-9.,-_\/]+:[a-zA-Z0-9.,-_\/]+$"
+        r"^urn:sdx:port:[a-zA-Z0-9.,\-_/]+:[a-zA-Z0-9.,\-_/]+:[a-zA-Z0-9.,\-_/]+$"
     )
+    _EMAIL_RE = re.compile(r"^\S+@\S+$")
+
+    _ANY_UNTAGGED_VLANS = frozenset({"any", "untagged"})
+    _SCHEDULING_KEYS = frozenset({"start_time", "end_time"})
+    _UPDATE_STATES = frozenset({"enabled", "disabled"})
+    # Inclusive (min, max) bounds for each supported QoS metric value.
+    _QOS_METRIC_RANGES = {
+        "min_bw": (0, 100),
+        "max_delay": (0, 1000),
+        "max_number_oxps": (1, 100),
+    }
+
+    # HTTP status messages reported by each API call on failure. Exceptions
+    # get a copy, so callers editing method_messages cannot alter them.
+    _CREATE_L2VPN_MESSAGES = {
+        201: "L2VPN Service Created",
+        400: "Request does not have a valid JSON or body is incomplete/incorrect",
+        401: "Not Authorized",
+        402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
+        409: "L2VPN Service already exists",
+        410: "Can't fulfill the strict QoS requirements",
+        411: "Scheduling not possible",
+        422: "Attribute not supported by the SDX-LC/OXPO",
+    }
+
+    _UPDATE_L2VPN_MESSAGES = {
+        201: "L2VPN Service Modified",
+        400: "Request does not have a valid JSON or body is incomplete/incorrect",
+        401: "Not Authorized",
+        402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
+        404: "L2VPN Service ID not found",
+        409: "Conflicts with a different L2VPN",
+        410: "Can't fulfill the strict QoS requirements",
+        411: "Scheduling not possible",
+    }
+
+    _GET_L2VPN_MESSAGES = {
+        200: "OK",
+        401: "Not Authorized",
+        404: "Service ID not found",
+    }
+
+    _GET_ALL_L2VPNS_MESSAGES = {
+        200: "OK",
+    }
+
+    _DELETE_L2VPN_MESSAGES = {
+        201: "L2VPN Deleted",
+        401: "Not Authorized",
+        404: "L2VPN Service ID provided does not exist",
+    }
+
+    _AVAILABLE_PORTS_MESSAGES = {
+        400: "Request does not have a valid JSON or body is incomplete/incorrect",
+        401: "Not Authorized",
+        404: "Topology endpoint not found",
+    }
 
     VERSION = "1.0"
 
@@ -70,6 +133,12 @@ class SDXClient:
         self._logger = logger or logging.getLogger(__name__)
         self._request_cache = {}
 
+        # Reuse pooled keep-alive connections across API calls.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     @property
     def base_url(self) -> str:
         """Getter for base_url attribute."""
@@ -78,7 +147,7 @@ class SDXClient:
     @base_url.setter
     def base_url(self, value: str):
         """Setter for base_url attribute."""
-        if not isinstance(value, str) or not value.strip():
+        if not isinstance(value, str) or not value or value.isspace():
             raise ValueError("Base URL must be a non-empty string.")
         self._base_url = value
 
@@ -91,7 +160,10 @@ class SDXClient:
     def name(self, value: Optional[str]):
         """Setter for name attribute."""
         if value is not None and (
-            not isinstance(value, str) or not value.strip() or len(value) > 50
+            not isinstance(value, str)
+            or not value
+            or value.isspace()
+            or len(value) > 50
         ):
             raise ValueError(
                 "Name must be a non-empty string with maximum 50 characters."
@@ -195,7 +267,6 @@ class SDXClient:
 
         vlans = set()
         vlan_ranges = set()
-        special_vlans = {"any", "all", "untagged"}
         has_vlan_range = False
         has_single_vlan = False
         has_special_vlan = False
@@ -203,20 +274,20 @@ class SDXClient:
 
         validated_endpoints = []
         for endpoint in endpoints:
-            validated_endpoint = self._validate_endpoint_dict(endpoint)
-            validated_endpoints.append(validated_endpoint)
+            vlan_kind = self._validate_endpoint_dict(endpoint)
+            validated_endpoints.append(endpoint)
 
             vlan_value = endpoint["vlan"]
-            if vlan_value in special_vlans:
+            if vlan_kind == "any":
+                vlans.add(vlan_value)
+                has_any_untagged = True
+            elif vlan_kind == "all":
                 vlans.add(vlan_value)
-                if vlan_value in {"any", "untagged"}:
-                    has_any_untagged = True
-                else:
-                    has_special_vlan = True
-            elif vlan_value.isdigit():
+                has_special_vlan = True
+            elif vlan_kind == "single":
                 has_single_vlan = True
                 vlans.add(vlan_value)
-            elif ":" in vlan_value:
+            else:
                 vlan_ranges.add(vlan_value)
                 has_vlan_range = True
 
@@ -240,17 +311,17 @@ class SDXClient:
 
         return validated_endpoints
 
-    def _validate_endpoint_dict(self, endpoint_dict: Dict[str, str]) -> Dict[str, str]:
+    def _validate_endpoint_dict(self, endpoint_dict: Dict[str, str]) -> str:
         """Validates a single endpoint dictionary.
 
         Args:
             endpoint_dict (Dict[str, str]): Endpoint dictionary.
 
         Returns:
-            Dict[str, str]: Validated endpoint dictionary.
+            str: Kind of the endpoint's VLAN, as returned by _check_endpoint.
 
         Raises:
-            TypeError: If endpoint_dict is not a dictionary.
+            TypeError: If endpoint_dict is not a dictionary, or port_id or VLAN is not a string.
             ValueError: If endpoint_dict does not contain required keys or VLAN is invalid.
         """
         if not isinstance(endpoint_dict, dict):
@@ -259,8 +330,10 @@ class SDXClient:
         # Validate 'port_id'
         if "port_id" not in endpoint_dict or not endpoint_dict["port_id"]:
             raise ValueError("Each endpoint must contain a non-empty 'port_id' key.")
-        if not re.match(self.PORT_ID_PATTERN, endpoint_dict["port_id"]):
-            raise ValueError(f"Invalid port_id format: {endpoint_dict['port_id']}")
+        port_id = endpoint_dict["port_id"]
+
+        if not isinstance(port_id, str):
+            raise TypeError("port_id must be a string.")
 
         # Validate 'vlan'
         if "vlan" not in endpoint_dict or not endpoint_dict["vlan"]:
@@ -270,38 +343,77 @@ class SDXClient:
         if not isinstance(vlan_value, str):
             raise TypeError("VLAN must be a string.")
 
-        valid_vlans = {"any", "all", "untagged"}
+        port_id_re = self._compile_port_id_pattern(self.PORT_ID_PATTERN)
+        return self._check_endpoint(port_id_re, port_id, vlan_value)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compile_port_id_pattern(pattern: str) -> "re.Pattern[str]":
+        """Compiles a port_id pattern once per distinct pattern string.
+
+        PORT_ID_PATTERN is read from the instance at validation time, so
+        overrides on a subclass or instance take effect.
+
+        Args:
+            pattern (str): Regular expression for a valid port_id.
+
+        Returns:
+            re.Pattern[str]: The compiled pattern.
+        """
+        return re.compile(pattern)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _check_endpoint(
+        port_id_re: "re.Pattern[str]", port_id: str, vlan_value: str
+    ) -> str:
+        """Checks the port_id format and VLAN value of an endpoint.
+
+        The result depends only on the arguments, so it is memoized;
+        clients reusing the same ports skip the regex and VLAN parsing.
+        The pattern is part of the key, so subclasses with their own
+        port_id pattern get their own cache entries.
+
+        Args:
+            port_id_re (re.Pattern[str]): Compiled port_id pattern to match.
+            port_id (str): Endpoint port identifier.
+            vlan_value (str): Endpoint VLAN value.
 
-        if vlan_value in valid_vlans:
-            pass  # Valid special VLAN value
-        elif vlan_value.isdigit():
-            vlan_int = int(vlan_value)
-            if not (1 <= vlan_int <= 4095):
+        Returns:
+            str: 'any' for 'any'/'untagged', 'all', 'single' for a VLAN ID,
+                or 'range' for 'VLAN ID1:VLAN ID2'.
+
+        Raises:
+            ValueError: If port_id or vlan_value is invalid.
+        """
+        if not port_id_re.fullmatch(port_id):
+            raise ValueError(f"Invalid port_id format: {port_id}")
+
+        if vlan_value in SDXClient._ANY_UNTAGGED_VLANS:
+            return "any"
+        if vlan_value == "all":
+            return "all"
+        if vlan_value.isdecimal():
+            if not (1 <= int(vlan_value) <= 4095):
                 raise ValueError(
                     f"Invalid VLAN value: '{vlan_value}'. Must be between 1 and 4095."
                 )
-        elif ":" in vlan_value:
-            vlan_range = vlan_value.split(":")
-            if len(vlan_range) != 2:
-                raise ValueError(
-                    f"Invalid VLAN range values: '{vlan_value}'. Must be 'VLAN ID1:VLAN ID2'."
-                )
-            try:
-                vlan_id1, vlan_id2 = map(int, vlan_range)
-                if not (1 <= vlan_id1 < vlan_id2 <= 4095):
-                    raise ValueError(
-                        f"Invalid VLAN range values: '{vlan_value}'. Must be between 1 and 4095, and VLAN ID1 must be less than VLAN ID2."
-                    )
-            except ValueError:
+            return "single"
+        if ":" in vlan_value:
+            # A second ':' leaves vlan_id2 non-decimal, so it is rejected too.
+            vlan_id1, _, vlan_id2 = vlan_value.partition(":")
+            if not (
+                vlan_id1.isdecimal()
+                and vlan_id2.isdecimal()
+                and 1 <= int(vlan_id1) < int(vlan_id2) <= 4095
+            ):
                 raise ValueError(
                     f"Invalid VLAN range format: '{vlan_value}'. Must be 'VLAN ID1:VLAN ID2'."
                 )
-        else:
-            raise ValueError(
-                f"Invalid VLAN value: '{vlan_value}'. Must be 'any', 'all', 'untagged', a string representing an integer between 1 and 4095, or a range."
-            )
-
-        return endpoint_dict
+            return "range"
+        raise ValueError(
+            f"Invalid VLAN value: '{vlan_value}'. Must be 'any', 'all', 'untagged', a string representing an integer between 1 and 4095, or a range."
+        )
 
     # Notifications Methods
     @staticmethod
@@ -314,10 +426,10 @@ class SDXClient:
         Returns:
             bool: True if the email address is valid, False otherwise.
         """
-        if not isinstance(email, str):
+        # Cheap membership test rejects strings without '@' before the regex.
+        if not isinstance(email, str) or "@" not in email:
             return False
-        email_regex = r"^\S+@\S+$"
-        return re.match(email_regex, email) is not None
+        return SDXClient._EMAIL_RE.match(email) is not None
 
     def _validate_notifications(
         self, notifications: Optional[List[Dict[str, str]]]
@@ -365,8 +477,23 @@ class SDXClient:
         Returns:
             bool: True if the timestamp is valid, False otherwise.
         """
-        timestamp_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$"
-        return re.match(timestamp_pattern, timestamp) is not None
+        # Pin the exact YYYY-MM-DDTHH:MM:SSZ layout; fromisoformat also accepts
+        # week dates, offsets and other ISO8601 variants.
+        if (
+            len(timestamp) != 20
+            or timestamp[4] != "-"
+            or timestamp[7] != "-"
+            or timestamp[10] != "T"
+            or timestamp[13] != ":"
+            or timestamp[16] != ":"
+            or timestamp[19] != "Z"
+        ):
+            return False
+        try:
+            datetime.fromisoformat(timestamp[:19])
+        except ValueError:
+            return False
+        return True
 
     # Scheduling Methods
     def _validate_scheduling(
@@ -387,9 +514,8 @@ class SDXClient:
         if not isinstance(scheduling, dict):
             raise TypeError("Scheduling must be a dictionary.")
 
-        valid_keys = {"start_time", "end_time"}
         for key in scheduling:
-            if key not in valid_keys:
+            if key not in self._SCHEDULING_KEYS:
                 raise ValueError(f"Invalid scheduling key: {key}")
 
             time = scheduling[key]
@@ -425,9 +551,8 @@ class SDXClient:
         if not isinstance(qos_metrics, dict):
             raise TypeError("QoS metrics must be a dictionary.")
 
-        valid_keys = {"min_bw", "max_delay", "max_number_oxps"}
         for key, value_dict in qos_metrics.items():
-            if key not in valid_keys:
+            if key not in self._QOS_METRIC_RANGES:
                 raise ValueError(f"Invalid QoS metric: {key}")
             if not isinstance(value_dict, dict):
                 raise TypeError(f"QoS metric value for '{key}' must be a dictionary.")
@@ -454,18 +579,11 @@ class SDXClient:
             raise TypeError(f"'strict' in QoS metric of '{key}' must be a boolean.")
 
         # Specific range checks for each key
-        if key == "min_bw":
-            if not 0 <= value_dict["value"] <= 100:
-                raise ValueError("qos_metric 'min_bw' value must be between 0 and 100.")
-        elif key == "max_delay":
-            if not 0 <= value_dict["value"] <= 1000:
-                raise ValueError(
-                    "qos_metric 'max_delay' value must be between 0 and 1000."
-                )
-        elif key == "max_number_oxps":
-            if not 1 <= value_dict["value"] <= 100:
+        if key in self._QOS_METRIC_RANGES:
+            min_value, max_value = self._QOS_METRIC_RANGES[key]
+            if not min_value <= value_dict["value"] <= max_value:
                 raise ValueError(
-                    "qos_metric 'max_number_oxps' value must be between 1 and 100."
+                    f"qos_metric '{key}' value must be between {min_value} and {max_value}."
                 )
 
         # 'strict' key validation (default False)
@@ -517,7 +635,7 @@ class SDXClient:
             return SDXResponse(response_json)
 
         try:
-            response = requests.post(url, json=payload, timeout=120)
+            response = self._session.post(url, json=payload, timeout=120)
             response.raise_for_status()
             response_json = response.json()
             cached_data = (payload, response_json)
@@ -536,23 +654,15 @@ class SDXClient:
             except ValueError:
                 error_details = e.response.text
 
-            method_messages = {
-                201: "L2VPN Service Created",
-                400: "Request does not have a valid JSON or body is incomplete/incorrect",
-                401: "Not Authorized",
-                402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
-                409: "L2VPN Service already exists",
-                410: "Can't fulfill the strict QoS requirements",
-                411: "Scheduling not possible",
-                422: "Attribute not supported by the SDX-LC/OXPO",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
+            error_message = self._CREATE_L2VPN_MESSAGES.get(
+                status_code, "Unknown error occurred."
+            )
             self._logger.error(
                 f"Failed to create L2VPN. Status code: {status_code}: {error_message}"
             )
             raise SDXException(
                 status_code=status_code,
-                method_messages=method_messages,
+                method_messages=dict(self._CREATE_L2VPN_MESSAGES),
                 message=error_message,
                 error_details=error_details,
             )
@@ -599,8 +709,9 @@ class SDXClient:
         payload = {"service_id": service_id}
 
         if state is not None:
-            if state.lower() in ["enabled", "disabled"]:
-                payload["state"] = state.lower()
+            state = state.lower()
+            if state in self._UPDATE_STATES:
+                payload["state"] = state
             else:
                 raise ValueError(
                     "Invalid state value. The 'state' attribute can only by changed to 'enabled' or 'disabled'."
@@ -619,13 +730,13 @@ class SDXClient:
             if value is not None:
                 payload[attr] = value
 
-        self._logger.debug(f"Sending request to update L2VPN with payload: {payload}")
+        self._logger.debug("Sending request to update L2VPN with payload: %s", payload)
 
         try:
-            response = requests.patch(url, json=payload, verify=True, timeout=120)
+            response = self._session.patch(url, json=payload, verify=True, timeout=120)
             response.raise_for_status()
             self._logger.info(
-                f"L2VPN update request sent to {url}, with payload: {payload}."
+                "L2VPN update request sent to %s, with payload: %s.", url, payload
             )
 
             # No response body on success, so return a success message
@@ -646,23 +757,15 @@ class SDXClient:
             except ValueError:
                 error_details = e.response.text
 
-            method_messages = {
-                201: "L2VPN Service Modified",
-                400: "Request does not have a valid JSON or body is incomplete/incorrect",
-                401: "Not Authorized",
-                402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
-                404: "L2VPN Service ID not found",
-                409: "Conflicts with a different L2VPN",
-                410: "Can't fulfill the strict QoS requirements",
-                411: "Scheduling not possible",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
+            error_message = self._UPDATE_L2VPN_MESSAGES.get(
+                status_code, "Unknown error occurred."
+            )
             self._logger.error(
                 f"Failed to update L2VPN. Status code: {status_code}: {error_message}"
             )
             raise SDXException(
                 status_code=status_code,
-                method_messages=method_messages,
+                method_messages=dict(self._UPDATE_L2VPN_MESSAGES),
                 message=error_message,
                 error_details=error_details,
             )
@@ -675,7 +778,7 @@ class SDXClient:
 
     def get_l2vpn(
         self, service_id: str, format: str = "dataframe"
-    ) -> Union[pd.DataFrame, SDXResponse]:
+    ) -> Union["pd.DataFrame", SDXResponse]:
         """Retrieves details of an existing L2VPN using the provided service ID.
 
         Args:
@@ -693,11 +796,11 @@ class SDXClient:
         url = f"{self.base_url}/l2vpn/{self.VERSION}/{service_id}"
 
         try:
-            response = requests.get(url, verify=True, timeout=120)
+            response = self._session.get(url, verify=True, timeout=120)
             response.raise_for_status()
             response_json = response.json()
             self._logger.info(f"L2VPN retrieval request sent to {url}.")
-            self._logger.info(f"Full response: {response_json}")
+            self._logger.debug("Full response: %s", response_json)
             l2vpn_data = response_json.get(service_id)
 
             if l2vpn_data is None:
@@ -709,6 +812,8 @@ class SDXClient:
 
             # Format as DataFrame if requested
             if format == "dataframe":
+                import pandas as pd
+
                 # Flatten the endpoints for each row in the DataFrame
                 node_info_list = [
                     {
@@ -757,20 +862,16 @@ class SDXClient:
             except ValueError:
                 error_details = e.response.text
 
-            method_messages = {
-                200: "OK",
-                401: "Not Authorized",
-                404: "Service ID not found",
-            }
-
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
+            error_message = self._GET_L2VPN_MESSAGES.get(
+                status_code, "Unknown error occurred."
+            )
             self._logger.error(
                 f"Failed to retrieve L2VPN. Status code: {status_code}: {error_message}"
             )
 
             raise SDXException(
                 status_code=status_code,
-                method_messages=method_messages,
+                method_messages=dict(self._GET_L2VPN_MESSAGES),
                 message=error_message,
                 error_details=error_details,
             )
@@ -778,12 +879,12 @@ class SDXClient:
             self._logger.error("Request timed out.")
             raise SDXException("The request to create the L2VPN timed out.")
         except RequestException as e:
-            logging.error(f"Failed to retrieve L2VPN: {e}")
+            self._logger.error(f"Failed to retrieve L2VPN: {e}")
             raise SDXException(f"Failed to retrieve L2VPN: {e}")
 
     def get_all_l2vpns(
         self, archived: bool = False, format: str = "dataframe"
-    ) -> Union[pd.DataFrame, Dict[str, SDXResponse]]:
+    ) -> Union["pd.DataFrame", Dict[str, SDXResponse]]:
         """
         Retrieves all L2VPNs, either archived or active.
 
@@ -807,12 +908,12 @@ class SDXClient:
         self._logger.info(f"Retrieving L2VPNs: URL={url}")
 
         try:
-            response = requests.get(url, verify=True, timeout=120)
+            response = self._session.get(url, verify=True, timeout=120)
             response.raise_for_status()
 
             l2vpns_json = response.json()
             self._logger.info(f"L2VPN retrieval request sent to {url}.")
-            self._logger.info(f"Retrieved L2VPNs successfully: {l2vpns_json}")
+            self._logger.debug("Retrieved L2VPNs successfully: %s", l2vpns_json)
 
             # Parse each L2VPN JSON into SDXResponse objects
             l2vpns = {
@@ -822,16 +923,17 @@ class SDXClient:
 
             # Format data for DataFrame if requested
             if format == "dataframe":
-                node_info_list = [
+                import pandas as pd
+
+                # Build column lists so pandas can skip per-row dict inference.
+                records = [vars(sdx_response) for sdx_response in l2vpns.values()]
+                columns = records[0] if records else {}
+                return pd.DataFrame(
                     {
-                        "service_id": service_id,
-                        **vars(
-                            sdx_response
-                        ),  # Convert SDXResponse attributes to dictionary
+                        column: [record[column] for record in records]
+                        for column in columns
                     }
-                    for service_id, sdx_response in l2vpns.items()
-                ]
-                return pd.DataFrame(node_info_list)
+                )
             elif format == "json":
                 return {
                     service_id: vars(sdx_response)
@@ -849,16 +951,15 @@ class SDXClient:
             except ValueError:
                 error_details = e.response.text
 
-            method_messages = {
-                200: "OK",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
+            error_message = self._GET_ALL_L2VPNS_MESSAGES.get(
+                status_code, "Unknown error occurred."
+            )
             self._logger.error(
                 f"Failed to retrieve L2VPNs. Status code: {status_code}: {error_message}"
             )
             raise SDXException(
                 status_code=status_code,
-                method_messages=method_messages,
+                method_messages=dict(self._GET_ALL_L2VPNS_MESSAGES),
                 message=error_message,
                 error_details=error_details,
             )
@@ -884,7 +985,7 @@ class SDXClient:
         url = f"{self.base_url}/l2vpn/{self.VERSION}/{service_id}"
 
         try:
-            response = requests.delete(url, verify=True, timeout=120)
+            response = self._session.delete(url, verify=True, timeout=120)
             response.raise_for_status()
             self._logger.info(f"L2VPN deletion request sent to {url}.")
             return response.json() if response.content else None
@@ -897,20 +998,16 @@ class SDXClient:
             except ValueError:
                 error_details = e.response.text
 
-            method_messages = {
-                201: "L2VPN Deleted",
-                401: "Not Authorized",
-                404: "L2VPN Service ID provided does not exist",
-            }
-
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
+            error_message = self._DELETE_L2VPN_MESSAGES.get(
+                status_code, "Unknown error occurred."
+            )
             self._logger.error(
                 f"Failed to retrieve L2VPN. Status code: {status_code}: {error_message}"
             )
 
             raise SDXException(
                 status_code=status_code,
-                method_messages=method_messages,
+                method_messages=dict(self._DELETE_L2VPN_MESSAGES),
                 message=error_message,
                 error_details=error_details,
             )
@@ -925,7 +1022,7 @@ class SDXClient:
 
     def get_available_ports(
         self, format: str = "dataframe"
-    ) -> Union[pd.DataFrame, List[Dict[str, str]]]:
+    ) -> Union["pd.DataFrame", List[Dict[str, str]]]:
         """Fetches and returns a list of available ports from the SDX topology.
 
         Args:
@@ -936,31 +1033,37 @@ class SDXClient:
 
         Raises:
             SDXException: If the API request fails or returns an error.
+            ValueError: If format is not "dataframe" or "json".
         """
+        # Reject a bad format before paying for the topology round trip.
+        if format not in ("dataframe", "json"):
+            raise ValueError("Invalid format specified. Use 'dataframe' or 'json'.")
+
         topology_url = f"{self._base_url}/topology"
 
         try:
-            response = requests.get(topology_url, timeout=10)
+            response = self._session.get(topology_url, timeout=10)
             response.raise_for_status()
             data = response.json()
 
-            # Extract available ports
-            port_list = []
-            for node in data.get("nodes", []):
-                for port in node.get("ports", []):
-                    if port.get("status") == "up" and not port.get("nni"):
-                        port_list.append(
-                            {"Port ID": port.get("id"), "Status": port.get("status")}
-                        )
+            # Extract available ports; only "up" ports are kept, so the
+            # status column is constant and only the IDs need collecting.
+            port_ids = [
+                port.get("id")
+                for node in data.get("nodes", [])
+                for port in node.get("ports", [])
+                if port.get("status") == "up" and not port.get("nni")
+            ]
 
             # Return in the requested format
             if format == "dataframe":
-                df = pd.DataFrame(port_list, index=None)
+                import pandas as pd
+
+                df = pd.DataFrame(
+                    {"Port ID": port_ids, "Status": ["up"] * len(port_ids)}
+                )
                 return df.style.hide(axis="index")
-            elif format == "json":
-                return port_list
-            else:
-                raise ValueError("Invalid format specified. Use 'dataframe' or 'json'.")
+            return [{"Port ID": port_id, "Status": "up"} for port_id in port_ids]
 
         except HTTPError as e:
             status_code = e.response.status_code
@@ -971,18 +1074,15 @@ class SDXClient:
             except ValueError:
                 error_details = e.response.text
 
-            method_messages = {
-                400: "Request does not have a valid JSON or body is incomplete/incorrect",
-                401: "Not Authorized",
-                404: "Topology endpoint not found",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
+            error_message = self._AVAILABLE_PORTS_MESSAGES.get(
+                status_code, "Unknown error occurred."
+            )
             self._logger.error(
                 f"Failed to retrieve available ports. Status code: {status_code}: {error_message}"
             )
             raise SDXException(
                 status_code=status_code,
-                method_messages=method_messages,
+                method_messages=dict(self._AVAILABLE_PORTS_MESSAGES),
                 message=error_message,
                 error_details=error_details,
             )
@@ -996,6 +1096,18 @@ class SDXClient:
             raise SDXException(f"Failed to retrieve available ports: {e}")
 
     # Utility Methods
+    def close(self) -> None:
+        """Closes the pooled HTTP session used for API requests."""
+        self._session.close()
+
+    def __enter__(self) -> "SDXClient":
+        """Returns the client for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the HTTP session when leaving the context manager."""
+        self.close()
+
     def __str__(self) -> str:
         """Returns a string description of the SDXClient instance."""
         return (
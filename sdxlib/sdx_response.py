@@ -67,6 +67,10 @@ class SDXResponse:
             and self.oxp_service_ids == other.oxp_service_ids
         )
 
+    def __hash__(self):
+        # Equal responses always share a service_id, so it is a valid hash key.
+        return hash(self.service_id)
+
     def __str__(self):
         current_path_str = (
             self.current_path[0]
@@ -12,7 +12,7 @@ class TestSDXClient(unittest.TestCase):
         self.client = create_client()
 
     # # API Call Succeeds
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("logging.getLogger")
     def test_create_l2vpn_success_with_logging(self, mock_get_logger, mock_post):
         """Tests successful L2VPN creation and logging."""
@@ -53,7 +53,7 @@ class TestSDXClient(unittest.TestCase):
             "L2VPN created successfully with service_id: 123"
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_l2vpn_error(self, mock_post):
         """Tests handling of RequestException during L2VPN creation."""
         # Set up mock error
@@ -110,7 +110,7 @@ class TestSDXClient(unittest.TestCase):
             client.create_l2vpn()
         self.assertEqual(str(context.exception), "Endpoints must be a list.")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_l2vpn_http_error(self, mock_post):
         """Tests handling of HTTP errors during L2VPN creation."""
         mock_response = Mock()
@@ -128,7 +128,7 @@ class TestSDXClient(unittest.TestCase):
             "Request does not have a valid JSON or body is incomplete/incorrect",
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("logging.getLogger")
     def test_create_l2vpn_timeout_logging(self, mock_get_logger, mock_post):
         """Tests timeout handling and logging for L2VPN creation."""
@@ -151,7 +151,7 @@ class TestSDXClient(unittest.TestCase):
             "The request to create the L2VPN timed out."
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("logging.getLogger")
     def test_create_l2vpn_request_exception_logging(self, mock_get_logger, mock_post):
         """Tests general request exception handling and logging for L2VPN creation."""
@@ -175,7 +175,7 @@ class TestSDXClient(unittest.TestCase):
             "An error occurred while creating L2VPN: Connection error"
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_l2vpn_caching(self, mock_post):
         """Tests caching mechanism by ensuring a single POST request is made."""
         mock_response = Mock()
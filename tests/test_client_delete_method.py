@@ -12,7 +12,7 @@ class TestSDXClient(unittest.TestCase):
         self.client = SDXClient(base_url=TEST_URL)
 
     # Successful Deletion
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_success(self, mock_delete):
         """Test successful deletion of an L2VPN."""
         mock_response = Mock()
@@ -31,7 +31,7 @@ class TestSDXClient(unittest.TestCase):
         )
 
     # Unauthorized error (401)
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_401_error(self, mock_delete):
         """Test handling of 401 error for L2VPN deletion."""
         mock_response = Mock()
@@ -45,7 +45,7 @@ class TestSDXClient(unittest.TestCase):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
     # Not found error (404)
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_404_error(self, mock_delete):
         """Test handling of 404 error for L2VPN deletion."""
         mock_response = Mock()
@@ -59,7 +59,7 @@ class TestSDXClient(unittest.TestCase):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
     # Logging success
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     @patch("logging.getLogger")
     def test_delete_l2vpn_logging_success(self, mock_get_logger, mock_delete):
         """Test logging of successful L2VPN deletion."""
@@ -83,7 +83,7 @@ class TestSDXClient(unittest.TestCase):
         )
 
     # Logging Error Conditions
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     @patch("logging.getLogger")
     def test_delete_l2vpn_logging_error_conditions(self, mock_get_logger, mock_delete):
         """Test logging of error conditions for L2VPN deletion."""
@@ -109,7 +109,7 @@ class TestSDXClient(unittest.TestCase):
         )
 
     # Request exceptions
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_request_exception(self, mock_delete):
         """Test handling of request exceptions during L2VPN deletion."""
         mock_delete.side_effect = RequestException("Network error")
@@ -120,7 +120,7 @@ class TestSDXClient(unittest.TestCase):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
     # Handle no content
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_no_content(self, mock_delete):
         """Test handling of response with no content for L2VPN deletion."""
         mock_response = Mock()
@@ -134,7 +134,7 @@ class TestSDXClient(unittest.TestCase):
         self.assertIsNone(result)
 
     # Verify Correct Exception Handling for Non-HTTPError Exceptions
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     @patch("logging.getLogger")
     def test_delete_l2vpn_general_request_exception(self, mock_get_logger, mock_delete):
         """Test handling of general RequestException during L2VPN deletion."""
@@ -156,7 +156,7 @@ class TestSDXClient(unittest.TestCase):
         mock_logger.error.assert_called_with("Failed to delete L2VPN: Network error")
 
     # Ensure Error Messages for All Status Codes
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_error_messages(self, mock_delete):
         """Test error messages for different status codes during L2VPN deletion."""
         for status_code, expected_message in {
@@ -181,7 +181,7 @@ class TestSDXClient(unittest.TestCase):
 
             self.assertEqual(cm.exception.message, expected_message)
 
-    @patch("requests.delete", side_effect=Timeout)
+    @patch("requests.Session.delete", side_effect=Timeout)
     @patch("logging.getLogger")
     def test_delete_l2vpn_timeout_logging(self, mock_get_logger, mock_delete):
         """Test logging of timeout exception during L2VPN deletion."""
@@ -74,6 +74,70 @@ class TestSDXClient(unittest.TestCase):
             ERROR_INVALID_PORT_ID_FORMAT,
         )
 
+    def test_endpoints_port_id_trailing_newline(self):
+        """Checks that the whole 'port_id' must match, including the end."""
+        port_id = "urn:sdx:port:test-oxp_url:test-node_name:test-port_name\n"
+        self.assert_invalid_endpoints(
+            [{"port_id": port_id, "vlan": "100"}, VLAN_200],
+            f"Invalid port_id format: {port_id}",
+        )
+
+    def test_endpoints_port_id_extra_segment(self):
+        """Checks that 'port_id' segments cannot contain ':' or other punctuation."""
+        for port_id in (
+            "urn:sdx:port:test-oxp_url:test-node_name:test-port_name:extra",
+            "urn:sdx:port:test-oxp_url:test-node_name:test-port@name",
+        ):
+            with self.subTest(port_id=port_id):
+                self.assert_invalid_endpoints(
+                    [{"port_id": port_id, "vlan": "100"}, VLAN_200],
+                    f"Invalid port_id format: {port_id}",
+                )
+
+    def test_endpoints_invalid_port_id_repeated(self):
+        """Checks that a cached endpoint check still rejects an invalid 'port_id' every time."""
+        for _ in range(2):
+            self.assert_invalid_endpoints(
+                [{"port_id": "invalid-port_id", "vlan": "100"}, VLAN_200],
+                ERROR_INVALID_PORT_ID_FORMAT,
+            )
+
+    def test_endpoints_port_id_not_string(self):
+        """Checks that a non-string 'port_id' raises a TypeError."""
+        self.assert_invalid_endpoints(
+            [{"port_id": ["urn:sdx:port:x:y:z"], "vlan": "100"}, VLAN_200],
+            "port_id must be a string.",
+            TypeError,
+        )
+
+    def test_endpoints_port_id_pattern_subclass(self):
+        """Checks that a subclass with a stricter 'port_id' pattern is honored."""
+
+        class StrictSDXClient(SDXClient):
+            PORT_ID_PATTERN = r"^urn:sdx:port:test-oxp_url:[a-z_-]+:[a-z0-9_-]+$"
+
+        endpoints = [{"port_id": "urn:sdx:port:x:y:z", "vlan": "100"}, VLAN_200]
+
+        # The base class accepts it first, so the endpoint check is cached.
+        self.client.endpoints = endpoints
+
+        client = StrictSDXClient(base_url=self.client.base_url)
+        with self.assertRaises(ValueError) as context:
+            client.endpoints = endpoints
+        self.assertEqual(
+            str(context.exception), "Invalid port_id format: urn:sdx:port:x:y:z"
+        )
+
+    def test_endpoints_port_id_pattern_instance(self):
+        """Checks that setting 'PORT_ID_PATTERN' on an instance is honored."""
+        endpoints = [{"port_id": "urn:sdx:port:x:y:z", "vlan": "100"}, VLAN_200]
+        self.client.endpoints = endpoints
+
+        self.client.PORT_ID_PATTERN = r"^urn:sdx:port:test-oxp_url:[a-z_-]+:[a-z0-9_-]+$"
+        self.assert_invalid_endpoints(
+            endpoints, "Invalid port_id format: urn:sdx:port:x:y:z"
+        )
+
     # Unit Tests for Endpoints[VLAN] Attribute #
     def test_endpoints_missing_vlan_key(self):
         """Checks that each endpoint contains a 'vlan' key."""
@@ -260,6 +324,21 @@ class TestSDXClient(unittest.TestCase):
             ERROR_INVALID_VLAN_VALUE.format("5000"),
         )
 
+    def test_endpoints_vlan_non_decimal_digits(self):
+        """Checks that a VLAN of non-decimal digits such as '²' raises a ValueError."""
+        for vlan_value in ["²", "1²"]:
+            with self.subTest(vlan=vlan_value):
+                self.assert_invalid_endpoints(
+                    [
+                        VLAN_UNTAGGED,
+                        {
+                            "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+                            "vlan": vlan_value,
+                        },
+                    ],
+                    ERROR_VLAN_INVALID.format(vlan_value),
+                )
+
     # VLAN range #
     def test_endpoints_vlan_range_valid(self):
         """Checks that setting a valid VLAN range works."""
@@ -420,6 +499,40 @@ class TestSDXClient(unittest.TestCase):
             ERROR_VLAN_RANGE_VALUE.format("4000:4096"),
         )
 
+    def test_endpoints_vlan_range_three_parts(self):
+        """Checks that a VLAN range with more than two parts raises a ValueError."""
+        self.assert_invalid_endpoints(
+            [
+                {
+                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+                    "vlan": "100:200:300",
+                },
+                {
+                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+                    "vlan": "100:200:300",
+                },
+            ],
+            ERROR_VLAN_RANGE_VALUE.format("100:200:300"),
+        )
+
+    def test_endpoints_vlan_range_signed_values(self):
+        """Checks that a VLAN range with signed or padded values raises a ValueError."""
+        for vlan_value in ["+100:200", "100: 200", "1_00:200"]:
+            with self.subTest(vlan=vlan_value):
+                self.assert_invalid_endpoints(
+                    [
+                        {
+                            "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+                            "vlan": vlan_value,
+                        },
+                        {
+                            "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+                            "vlan": vlan_value,
+                        },
+                    ],
+                    ERROR_VLAN_RANGE_VALUE.format(vlan_value),
+                )
+
     def test_endpoints_vlan_range_and_invalid_vlan(self):
         """Checks that setting a VLAN range and an invalid VLAN value raises a ValueError."""
         self.assert_invalid_endpoints(
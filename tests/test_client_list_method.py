@@ -18,7 +18,7 @@ class TestSDXClient(unittest.TestCase):
     def setUp(self):
         self.client = SDXClient(base_url=TEST_URL)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_success(self, mock_get_logger, mock_get):
         """Test successful retrieval of an L2VPN."""
@@ -44,7 +44,7 @@ class TestSDXClient(unittest.TestCase):
             f"L2VPN retrieval request sent to {TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}."
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_logging_success(self, mock_get_logger, mock_get):
         """Test logging of successful L2VPN retrieval."""
@@ -70,7 +70,7 @@ class TestSDXClient(unittest.TestCase):
         )
         mock_get_logger().info.assert_called_with(expected_message)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_404_error(self, mock_get):
         """Test handling of 404 error for L2VPN retrieval."""
         mock_response = Mock()
@@ -88,7 +88,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn("invalid_id")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_401_error(self, mock_get):
         """Test handling of 401 error for L2VPN retrieval."""
         mock_response = Mock()
@@ -106,7 +106,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_logging_404_error(self, mock_get_logger, mock_get):
         """Test logging of 404 error for L2VPN retrieval."""
@@ -131,7 +131,7 @@ class TestSDXClient(unittest.TestCase):
             "Failed to retrieve L2VPN. Status code: 404: Service ID not found"
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_logging_401_error(self, mock_get_logger, mock_get):
         """Test logging of 401 error for L2VPN retrieval."""
@@ -156,7 +156,7 @@ class TestSDXClient(unittest.TestCase):
             "Failed to retrieve L2VPN. Status code: 401: Not Authorized"
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_request_exception(self, mock_get):
         """Test handling of request exceptions during L2VPN retrieval."""
         mock_get.side_effect = RequestException("Network error")
@@ -164,7 +164,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_json_parsing_error(self, mock_get):
         """Test handling of JSON parsing errors during L2VPN retrieval."""
         mock_response = Mock()
@@ -178,7 +178,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_valid_url_construction(self, mock_get):
         """Test valid URL construction for L2VPN retrieval."""
         # Prepare the mock response to return the expected structure
@@ -201,7 +201,7 @@ class TestSDXClient(unittest.TestCase):
         self.assertEqual(result.service_id, TEST_SERVICE_ID)
         self.assertEqual(result.name, "VLAN between AMPATH/300 and TENET/150")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_active(self, mock_get_logger, mock_get):
         """Test retrieving active L2VPNs."""
@@ -238,11 +238,12 @@ class TestSDXClient(unittest.TestCase):
             },
         )
 
-        mock_get_logger().info.assert_called_with(
-            "Retrieved L2VPNs successfully: {'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'ownership': 'user1', 'creation_date': '20240522T00:00:00Z', 'archived_date': '0', 'status': 'up', 'state': 'enabled', 'counters_location': 'https://my.aw-sdx.net/l2vpn/7cdf23e8978c', 'last_modified': '0', 'current_path': ['urn:sdx:link:tenet.ac.za:LinkToAmpath'], 'oxp_service_ids': {'ampath.net': ['c73da8e1'], 'Tenet.ac.za': ['5d034620']}}}"
+        mock_get_logger().debug.assert_called_with(
+            "Retrieved L2VPNs successfully: %s",
+            mock_response.json.return_value,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_archived(self, mock_get_logger, mock_get):
         """Test retrieving archived L2VPNs."""
@@ -263,11 +264,12 @@ class TestSDXClient(unittest.TestCase):
         }
         self.assertEqual(result, expected_result)
 
-        mock_get_logger().info.assert_called_with(
-            "Retrieved L2VPNs successfully: {'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'archived_date': '20240101T00:00:00Z'}}"
+        mock_get_logger().debug.assert_called_with(
+            "Retrieved L2VPNs successfully: %s",
+            mock_response.json.return_value,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_logging_retrieval(self, mock_get_logger, mock_get):
         """Test logging of L2VPN retrieval."""
@@ -279,11 +281,12 @@ class TestSDXClient(unittest.TestCase):
         mock_get.return_value = mock_response
         client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
         client.get_all_l2vpns()
-        mock_get_logger().info.assert_called_with(
-            "Retrieved L2VPNs successfully: {'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'archived_date': '0'}}"
+        mock_get_logger().debug.assert_called_with(
+            "Retrieved L2VPNs successfully: %s",
+            mock_response.json.return_value,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_all_l2vpns_empty_list(self, mock_get):
         """Test handling of empty L2VPN list."""
         mock_response = Mock()
@@ -296,7 +299,7 @@ class TestSDXClient(unittest.TestCase):
         result = client.get_all_l2vpns()
         self.assertEqual(result, {})
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_all_l2vpns_request_exception(self, mock_get):
         """Test handling of request exceptions during L2VPN retrieval."""
         mock_get.side_effect = RequestException("Network error")
@@ -306,7 +309,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_all_l2vpns()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_logging_error_conditions(self, mock_get_logger, mock_get):
         """Test logging of error conditions for retrieving L2VPNs."""
@@ -323,7 +326,7 @@ class TestSDXClient(unittest.TestCase):
             "Failed to retrieve L2VPNs. Status code: 404: Unknown error occurred."
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_all_l2vpns_empty_json_response(self, mock_get):
         """Test handling of empty JSON response for retrieving all L2VPN"""
         mock_response = Mock()
@@ -336,6 +339,63 @@ class TestSDXClient(unittest.TestCase):
         result = client.get_all_l2vpns()
         self.assertEqual(result, {})
 
+    @patch("requests.Session.get")
+    def test_get_all_l2vpns_dataframe(self, mock_get):
+        """Test that each L2VPN becomes a DataFrame row with SDXResponse columns."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = MOCK_RESPONSE
+        mock_get.return_value = mock_response
+
+        result = self.client.get_all_l2vpns(format="dataframe")
+
+        self.assertEqual(
+            list(result.columns), list(vars(SDXResponse(MOCK_RESPONSE[TEST_SERVICE_ID])))
+        )
+        self.assertEqual(list(result["service_id"]), [TEST_SERVICE_ID])
+        self.assertEqual(list(result["status"]), ["up"])
+
+    @patch("requests.Session.get")
+    def test_get_available_ports_json(self, mock_get):
+        """Test that only up, non-NNI ports are listed as available."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "nodes": [
+                {
+                    "ports": [
+                        {"id": "urn:sdx:port:ampath.net:Ampath3:50", "status": "up"},
+                        {"id": "urn:sdx:port:ampath.net:Ampath3:51", "status": "down"},
+                        {
+                            "id": "urn:sdx:port:ampath.net:Ampath3:52",
+                            "status": "up",
+                            "nni": "urn:sdx:port:sax.br:Rtr01:52",
+                        },
+                    ]
+                },
+                {"ports": [{"id": "urn:sdx:port:sax.br:Rtr01:50", "status": "up"}]},
+            ]
+        }
+        mock_get.return_value = mock_response
+
+        result = self.client.get_available_ports(format="json")
+
+        self.assertEqual(
+            result,
+            [
+                {"Port ID": "urn:sdx:port:ampath.net:Ampath3:50", "Status": "up"},
+                {"Port ID": "urn:sdx:port:sax.br:Rtr01:50", "Status": "up"},
+            ],
+        )
+        mock_get.assert_called_once_with(f"{TEST_URL}/topology", timeout=10)
+
+    @patch("requests.Session.get")
+    def test_get_available_ports_invalid_format(self, mock_get):
+        """Test that an invalid format is rejected without fetching the topology."""
+        with self.assertRaises(ValueError):
+            self.client.get_available_ports(format="xml")
+        mock_get.assert_not_called()
+
 
 # Run the tests
 if __name__ == "__main__":
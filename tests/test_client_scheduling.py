@@ -76,6 +76,20 @@ class TestSDXClientScheduling(unittest.TestCase):
             invalid_scheduling, ERROR_SCHEDULING_FORMAT,
         )
 
+    def test_invalid_scheduling_out_of_range_values(self):
+        """Tests well-shaped timestamps whose date or time fields are out of range."""
+        for start_time in (
+            "2024-13-01T10:00:00Z",
+            "2024-02-30T10:00:00Z",
+            "2024-07-04T25:00:00Z",
+            "2024-W27-4T10:00:00Z",
+            "2024-07-04T10:00+00Z",
+        ):
+            with self.subTest(start_time=start_time):
+                self.assert_invalid_scheduling(
+                    {"start_time": start_time}, ERROR_SCHEDULING_FORMAT,
+                )
+
     def test_invalid_scheduling_end_before_start(self):
         """Tests invalid scheduling where end_time is before start_time."""
         invalid_scheduling = {
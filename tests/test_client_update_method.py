@@ -13,7 +13,7 @@ class TestSDXClient(unittest.TestCase):
         self.client = SDXClient(base_url=TEST_URL)
 
     ## Test successful L2VPN update
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_successful_l2vpn_update(self, mock_patch):
         """Test that a valid update request is successful."""
         mock_response = Mock()
@@ -46,7 +46,7 @@ class TestSDXClient(unittest.TestCase):
         mock_patch.assert_called_once()
 
     ## Test Update with Invalid JSON or Incomplete Body: 400 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_invalid_json_or_incomplete_body(self, mock_patch):
         """Test that an invalid JSON or incomplete body results in a 400 error."""
         mock_response = Mock()
@@ -58,7 +58,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Unauthorized Update: 401 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_unauthorized_update(self, mock_patch):
         """Test that an unauthorized update results in a 401 error."""
         mock_response = Mock()
@@ -70,7 +70,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with Incompatible Request: 402 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_incompatible_request(self, mock_patch):
         """Test that an incompatible request results in a 402 error."""
         mock_response = Mock()
@@ -82,7 +82,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update of Non-Existing L2VPN: 404 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_non_existing_l2vpn(self, mock_patch):
         """Test that updating a non-existing L2VPN results in a 404 error."""
         mock_response = Mock()
@@ -94,7 +94,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with Conflicting L2VPN: 409 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_conflicting_l2vpn(self, mock_patch):
         """Test that an update with a conflicting L2VPN results in a 409 error."""
         mock_response = Mock()
@@ -106,7 +106,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update of Archived L2VPN: 410 status code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_archived_l2vpn(self, mock_patch):
         """Test that updating an archived L2VPN results in a 410 status code."""
         mock_response = Mock()
@@ -118,7 +118,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with QoS Requirements Not Fulfilled: 410 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_qos_requirements_not_fulfilled(self, mock_patch):
         """Test that unfulfilled QoS requirements result in a 410 error."""
         mock_response = Mock()
@@ -130,7 +130,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with Scheduling Not Possible: 411 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_scheduling_not_possible(self, mock_patch):
         """Test that scheduling not possible results in a 411 error."""
         mock_response = Mock()
@@ -154,7 +154,7 @@ class TestSDXClient(unittest.TestCase):
         mock_logger.info.assert_called_once_with("Test log message")
 
     @patch("logging.getLogger")
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_logging_successful_update(self, mock_patch, mock_get_logger):
         """Test that a successful update logs an info message."""
 
@@ -182,13 +182,17 @@ class TestSDXClient(unittest.TestCase):
         expected_payload = {"service_id": TEST_SERVICE_ID, "state": "enabled"}
 
         # Construct the expected log messages
-        expected_request_log = f"L2VPN update request sent to {expected_url}, with payload: {expected_payload}."
+        expected_request_log = (
+            "L2VPN update request sent to %s, with payload: %s.",
+            expected_url,
+            expected_payload,
+        )
         expected_success_log = (
             f"L2VPN with service_id {TEST_SERVICE_ID} was successfully updated."
         )
 
         # Assert that both log messages were logged
-        mock_logger.info.assert_any_call(expected_request_log)
+        mock_logger.info.assert_any_call(*expected_request_log)
         mock_logger.info.assert_any_call(expected_success_log)
 
         # Assert that both log calls occurred (i.e., two info calls were made)
@@ -196,7 +200,7 @@ class TestSDXClient(unittest.TestCase):
 
     ## Test Logging for Update Errors
     @patch("logging.getLogger")
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_logging_update_errors(self, mock_patch, mock_get_logger):
         """Test that update errors are logged as error messages."""
         mock_response = Mock()
@@ -220,6 +224,26 @@ class TestSDXClient(unittest.TestCase):
         expected_message = "Failed to update L2VPN. Status code: 400: Request does not have a valid JSON or body is incomplete/incorrect"
         mock_logger.error.assert_called_with(expected_message)
 
+    ## Test that each exception gets its own copy of the error messages
+    @patch("requests.Session.patch")
+    def test_update_error_method_messages_copy(self, mock_patch):
+        """Test that editing an exception's method_messages does not leak into later errors."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
+        mock_patch.return_value = mock_response
+
+        with self.assertRaises(SDXException) as first:
+            self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
+        self.assertIsInstance(first.exception.method_messages, dict)
+        first.exception.method_messages[404] = "Changed"
+
+        with self.assertRaises(SDXException) as second:
+            self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
+        self.assertEqual(
+            second.exception.method_messages[404], "L2VPN Service ID not found"
+        )
+
     ## Test Handling of Invalid 'state' Values
     def test_invalid_state_values(self):
         """Test that invalid 'state' values raise a ValueError."""
@@ -227,7 +251,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="invalid")
 
     ## Test Update with Valid 'state' Values
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_valid_state_values(self, mock_patch):
         """Test that valid 'state' values are processed correctly."""
         mock_response = Mock()
@@ -246,7 +270,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn()
 
     ## Test Empty Payload
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_empty_payload(self, mock_patch):
         """Test that an empty payload still sends a correct request."""
         mock_response = Mock()
@@ -264,13 +288,13 @@ class TestSDXClient(unittest.TestCase):
         )
 
     ## Test Handling of Timeout and RequestException
-    @patch("requests.patch", side_effect=Timeout)
+    @patch("requests.Session.patch", side_effect=Timeout)
     def test_timeout_exception(self, mock_patch):
         """Test that a Timeout exception raises an SDXException."""
         with self.assertRaises(SDXException):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
-    @patch("requests.patch", side_effect=RequestException("Connection error"))
+    @patch("requests.Session.patch", side_effect=RequestException("Connection error"))
     def test_request_exception(self, mock_patch):
         """Test that a RequestException raises an SDXException."""
         with self.assertRaises(SDXException):
@@ -53,5 +53,22 @@ class TestSDXClientStringRepresentation(unittest.TestCase):
         self.assertEqual(repr(client), expected_repr)
 
 
+class TestSDXClientSession(unittest.TestCase):
+    @patch("requests.Session.close")
+    def test_close_method(self, mock_close):
+        """Test that close() releases the pooled HTTP session."""
+        client = SDXClient(base_url="http://fake-api-url.com")
+        client.close()
+        mock_close.assert_called_once()
+
+    @patch("requests.Session.close")
+    def test_context_manager(self, mock_close):
+        """Test that the client closes its HTTP session on leaving a with block."""
+        with SDXClient(base_url="http://fake-api-url.com") as client:
+            self.assertIsInstance(client, SDXClient)
+            mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
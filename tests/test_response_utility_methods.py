@@ -89,6 +89,22 @@ class TestSDXResponseMethods(unittest.TestCase):
 
         self.assertNotEqual(response1, response3)
 
+    def test_hash_method(self):
+        """Test that equal SDXResponse objects hash alike and deduplicate in sets."""
+        response_json = {
+            "service_id": "12345",
+            "ownership": "user1",
+            "status": "up",
+            "state": "enabled",
+        }
+        response1 = SDXResponse(response_json)
+        response2 = SDXResponse(dict(response_json))
+        response3 = SDXResponse({**response_json, "service_id": "54321"})
+
+        self.assertEqual(hash(response1), hash(response2))
+        self.assertEqual(len({response1, response2, response3}), 2)
+        self.assertIn(response2, {response1: "l2vpn"})
+
 
 if __name__ == "__main__":
     unittest.main()